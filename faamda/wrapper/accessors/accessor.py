@@ -1,4 +1,5 @@
 import contextlib
+import os.path
 
 from ..models import *
 from .. import wrapper
@@ -7,17 +8,59 @@ class DataAccessor(object):
     model = CoreNetCDFDataModel
     fileattrs = ('version', 'revision', 'freq')
     regex = None
+    # File name extensions that regex can match, so that other files can be
+    # skipped without trying regex. None if not known, in which case no
+    # files are skipped.
+    extensions = None
 
-    def __init__(self, flight):
+    def __init__(self, flight, **options):
+        """
+        Args:
+            flight (:obj:`FAAMFlight`): Flight the accessor's files are from.
+            **options: Keyword arguments passed on to each model made, for
+                those named in the model's `options`, and otherwise ignored.
+        """
         self._files = []
         self._version = None
         self._revision = None
         self._freq = None
+        self._model = None
+        self._model_mtime = None
+        self._options = options
 
         self.flight = flight
 
     def __getitem__(self, item):
-        return self.model(self.file)[item]
+        return self._get_model()[item]
+
+    def _get_model(self):
+        """Returns model of the selected file, reused while it is selected
+
+        A new model is made if the file has been modified since the last
+        one was, so that nothing the model has read from it is stale.
+        """
+        _file = self.file
+        _mtime = os.path.getmtime(_file)
+        if (self._model is None or self._model.path != _file
+                or self._model_mtime != _mtime):
+            self.close()
+            self._model = self._new_model(_file)
+            self._model_mtime = _mtime
+
+        return self._model
+
+    def _new_model(self, path):
+        """Returns a new model of path, with the options the model takes"""
+        _options = {k: v for k, v in self._options.items()
+                    if k in self.model.options}
+        return self.model(path, **_options)
+
+    def close(self):
+        """Closes and drops the model of the selected file, if there is one"""
+        if self._model is not None:
+            self._model.close()
+        self._model = None
+        self._model_mtime = None
 
     def _autoset_version(self):
         try:
@@ -83,13 +126,13 @@ class DataAccessor(object):
         Get some sort of data from the DataModel. Implementation is down to the
         DataModel.
         """
-        return self.model(self.file).get(*args, **kwargs)
+        return self._get_model().get(*args, **kwargs)
 
     def find(self, *args, **kwargs):
         """
         Return what's available in the data file, via the DataModel.
         """
-        return self.model(self.file).find(*args, **kwargs)
+        return self._get_model().find(*args, **kwargs)
 
     @property
     @contextlib.contextmanager
@@ -99,7 +142,7 @@ class DataAccessor(object):
         DataModel.
 
         """
-        with self.model(self.file) as h:
+        with self._new_model(self.file) as h:
             yield h
 
     @property
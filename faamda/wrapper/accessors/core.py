@@ -12,9 +12,10 @@ __all__ = ['CoreAccessor',
 @register_accessor
 class CoreAccessor(DataAccessor):
     hook = 'core'
+    extensions = ('.nc',)
     regex = ('^core_faam_(?P<date>[0-9]{8})_v00(?P<version>[0-9])_'
               'r(?P<revision>[0-9]+)_(?P<flightnum>[a-z][0-9]{3})_'
-              '?(?P<freq>[1-9]*)h?z?(_prelim)?.nc$')
+              r'?(?P<freq>[1-9]*)h?z?(_prelim)?\.nc$')
 
     @property
     def takeoff_time(self):
@@ -160,12 +161,13 @@ class CoreFltSumAccessor(DataAccessor):
     # Override default model in accessor.DataAccessor()
     model = FltSumDataModel
     fileattrs = ('revision', 'ext')
-    regex = ('^flight-sum_faam_(?P<date>\d{8})_'
-             'r(?P<revision>\d+)_(?P<flightnum>[a-z]\d{3}).(?P<ext>csv|txt)$')
+    extensions = ('.csv', '.txt')
+    regex = (r'^flight-sum_faam_(?P<date>\d{8})_'
+             r'r(?P<revision>\d+)_(?P<flightnum>[a-z]\d{3})\.(?P<ext>csv|txt)$')
 
-    def __init__(self, flight):
+    def __init__(self, flight, **options):
         self._ext = None
-        super().__init__(flight)
+        super().__init__(flight, **options)
 
     def _autoset_file(self):
         _exts = [i.ext for i in self._files]
@@ -211,13 +213,13 @@ class CoreFltSumAccessor(DataAccessor):
 
     def get_event(self, time, within=None):
 
-        return self.model(self.file)._get_time_event(time, within)
+        return self._get_model()._get_time_event(time, within)
 
 
     def get_time(self, event):
         """ Returns (start,stop), or (start,None), times of event.
         """
-        return self.model(self.file)._get_event_time(event)
+        return self._get_model()._get_event_time(event)
 
 
     def index(self, event):
@@ -16,8 +16,9 @@ class CoreCloudPhysicsAccessor(DataAccessor):
     """
     hook = 'ccp'
     model = NetCDFDataModel
+    extensions = ('.nc',)
     regex = ('^core-cloud-phy_faam_(?P<date>[0-9]{8})_v(?P<version>[0-9]{3})_'
-             'r(?P<revision>[0-9]+)_(?P<flightnum>[a-z][0-9]{3}).nc$')
+             r'r(?P<revision>[0-9]+)_(?P<flightnum>[a-z][0-9]{3})\.nc$')
 
 
 @register_accessor
@@ -29,8 +30,9 @@ class CoreCloudPhysicsCIP15Accessor(DataAccessor):
     """
     hook = 'ccpCIP15'
     model = NetCDFDataModel
+    extensions = ('.nc',)
     regex = ('^core-cloud-phy_faam_(?P<date>[0-9]{8})_v(?P<version>[0-9]{3})_'
-             'r(?P<revision>[0-9]+)_(?P<flightnum>[a-z][0-9]{3})_cip15.nc$')
+             r'r(?P<revision>[0-9]+)_(?P<flightnum>[a-z][0-9]{3})_cip15\.nc$')
 
 
 @register_accessor
@@ -42,8 +44,9 @@ class CoreCloudPhysicsCIP25Accessor(DataAccessor):
     """
     hook = 'ccpCIP25'
     model = NetCDFDataModel
+    extensions = ('.nc',)
     regex = ('^core-cloud-phy_faam_(?P<date>[0-9]{8})_v(?P<version>[0-9]{3})_'
-             'r(?P<revision>[0-9]+)_(?P<flightnum>[a-z][0-9]{3})_cip25.nc$')
+             r'r(?P<revision>[0-9]+)_(?P<flightnum>[a-z][0-9]{3})_cip25\.nc$')
 
 
 @register_accessor
@@ -55,8 +58,9 @@ class CoreCloudPhysicsCIP100Accessor(DataAccessor):
     """
     hook = 'ccpCIP100'
     model = NetCDFDataModel
+    extensions = ('.nc',)
     regex = ('^core-cloud-phy_faam_(?P<date>[0-9]{8})_v(?P<version>[0-9]{3})_'
-             'r(?P<revision>[0-9]+)_(?P<flightnum>[a-z][0-9]{3})_cip100.nc$')
+             r'r(?P<revision>[0-9]+)_(?P<flightnum>[a-z][0-9]{3})_cip100\.nc$')
 
 
 @register_accessor
@@ -66,8 +70,9 @@ class CoreCloudPhysicsCASAccessor(DataAccessor):
     """
     hook = 'ccpCAS'
     model = NetCDFDataModel
+    extensions = ('.nc',)
     regex = ('^core-cloud-phy_faam_(?P<date>[0-9]{8})_v(?P<version>[0-9]{3})_'
-             'r(?P<revision>[0-9]+)_(?P<flightnum>[a-z][0-9]{3})_cas.nc$')
+             r'r(?P<revision>[0-9]+)_(?P<flightnum>[a-z][0-9]{3})_cas\.nc$')
 
 @register_accessor
 class CoreCloudPhysicsCDPcalAccessor(DataAccessor):
@@ -76,8 +81,9 @@ class CoreCloudPhysicsCDPcalAccessor(DataAccessor):
     """
     hook = 'ccpCDPcal'
     model = NetCDFDataModel
+    extensions = ('.nc',)
     regex = ('^(?P<flightnum>CDP-?[0-1])_faam_(?P<date>[0-9]{8})_v(?P<version>[0-9]{3})_'
-             'r(?P<revision>[0-9]+)_cal.nc$')
+             r'r(?P<revision>[0-9]+)_cal\.nc$')
 
 @register_accessor
 class CoreCloudPhysicsPCASPcalAccessor(DataAccessor):
@@ -86,6 +92,7 @@ class CoreCloudPhysicsPCASPcalAccessor(DataAccessor):
     """
     hook = 'ccpPCASPcal'
     model = NetCDFDataModel
+    extensions = ('.nc',)
     regex = ('^(?P<flightnum>PCASP-?[0-1])_faam_(?P<date>[0-9]{8})_v(?P<version>[0-9]{3})_'
-             'r(?P<revision>[0-9]+)_cal.nc$')
+             r'r(?P<revision>[0-9]+)_cal\.nc$')
 
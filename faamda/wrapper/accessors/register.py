@@ -3,7 +3,8 @@ import re
 def register_accessor(cls):
     reg_accessors[cls.hook] = { 
         'class': cls,
-        'regex': re.compile(cls.regex,re.I)
+        'regex': re.compile(cls.regex,re.I),
+        'extensions': cls.extensions
     }   
     return cls 
 
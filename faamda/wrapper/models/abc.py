@@ -6,11 +6,26 @@ class DataModel(abc.ABC):
     Defines an interface for a DataModel.
     """
 
+    # Names of the keyword arguments, besides path, that the model takes and
+    # that accessors pass on to it
+    options = ()
+
     def __init__(self, path):
         self.path = path
-        self.time = None
+        self._time = None
         self.handle = None
 
+    @property
+    def time(self):
+        """
+        Time coordinate of the model's file, None if it has not been read
+        """
+        return self._time
+
+    @time.setter
+    def time(self, time):
+        self._time = time
+
     @abc.abstractmethod
     def __enter__(self):
         """
@@ -23,6 +38,11 @@ class DataModel(abc.ABC):
         Context manager exit
         """
 
+    def close(self):
+        """
+        Release anything held open for the model's file
+        """
+
     @abc.abstractmethod
     def __getitem__(self, item):
         """
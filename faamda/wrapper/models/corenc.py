@@ -1,12 +1,13 @@
 import datetime
 import re
 
-from netCDF4 import Dataset, num2date
+from netCDF4 import num2date
 
 import numpy as np
 import pandas as pd
 
 from .abc import DataModel
+from .netcdf import _LOCK, _forget, _open_dataset
 
 __all__ = ['CoreNetCDFDataModel']
 
@@ -24,6 +25,9 @@ ROOT_STRINGS = ['', '/']
 # Variable attribute names to search when filtering by attribute
 SEARCH_ATTRS = ['long_name', 'standard_name', 'comment']
 
+# Sample spacing in ns for the frequencies found in FAAM core files
+_STEP_NS = {f: 10**9 // f for f in (1, 2, 4, 8, 16, 32, 64, 128)}
+
 
 class CoreNetCDFDataModel(DataModel):
     """Returns requested data or metadata from path
@@ -32,6 +36,13 @@ class CoreNetCDFDataModel(DataModel):
 
     """
 
+    def __init__(self, path):
+        super().__init__(path)
+        self._freq_cache = {}
+        self._time_cache = {}
+        self.time_start = None
+        self.time_end = None
+
     def __getitem__(self, item):
 
         if type(item) is str:
@@ -39,34 +50,63 @@ class CoreNetCDFDataModel(DataModel):
         else:
             items = item
 
-        return self._get_if_consistent(items)
-
-    def _get_vars(self, items):
-        with Dataset(self.path, 'r') as nc:
-            max_freq = max([self._get_freq(nc[i]) for i in items])
-            df = pd.DataFrame(index=self._time_at(max_freq))
-
-            for item in items:
-
-                _data = pd.Series(nc[item][:].ravel().astype(float),
-                                  index=self._time_at(self._get_freq(nc[item])))
-                df[item] = _data.reindex_like(df, method='bfill', limit=1)
-
-                # _data = nc[item][:].ravel().astype(float)
-                # _data[_data.mask] = np.nan
-                # _time = self._time_at(self._get_freq(nc[item]))
-                # df.loc[_time, item] = _data
-        return df
-
-    def _get_attrs(self, items):
+        return self._get_if_consistent(items, self._open())
+
+    def _open(self):
+        """Returns the open Dataset of the file, opening it if needed.
+
+        The handle is the one cached for the file by the netCDF models, so
+        that however many core models are kept only a bounded number of
+        files are open at once.
+        """
+        return _open_dataset(self.path)
+
+    def close(self):
+        """Drops any cached handle of the file, see `NetCDFDataModel.close()`"""
+        with _LOCK:
+            _forget(self.path)
+
+    def _get_vars(self, items, nc):
+        freqs = [self._get_freq(nc[i]) for i in items]
+        max_freq = max(freqs)
+        index = self._time_at(max_freq, nc)
+
+        # Fill a single NaN initialised (time, item) array and build the
+        # frame from it once, rather than inserting column by column. The
+        # array has the narrowest floating dtype that holds all the items.
+        _dtype = np.result_type(*[self._get_dtype(nc[i]) for i in items])
+        out = np.full((len(index), len(items)), np.nan, dtype=_dtype,
+                      order='F')
+        for j, (item, freq) in enumerate(zip(items, freqs)):
+            # Missing data are still masked, but a variable without any is
+            # read as a plain ndarray, which np.ma.filled passes straight
+            # through. The handle is shared, and xarray turns masking off
+            # for the variables it reads, so masking is turned on here.
+            nc[item].set_auto_maskandscale(True)
+            nc[item].set_always_mask(False)
+            _data = np.ma.filled(nc[item][:].astype(_dtype, copy=False),
+                                 np.nan)
+
+            # Lower frequency data are placed at their own time stamps in
+            # the max_freq index, with NaN in between. For FAAM
+            # frequencies this is just every (max_freq/freq)th row.
+            _rows = slice(None, None, max_freq // freq)
+            if max_freq % freq:
+                # Use the first row at or after each sample's time stamp
+                _rows = -(-np.arange(_data.size) * max_freq // freq)
+
+            out[_rows, j] = _data.ravel()
+
+        return pd.DataFrame(out, index=index, columns=items, copy=False)
+
+    def _get_attrs(self, items, nc):
         _attrs = {}
-        with Dataset(self.path, 'r') as nc:
-            for item in items:
-                _attrs[item] = getattr(nc, item)
+        for item in items:
+            _attrs[item] = getattr(nc, item)
 
         return _attrs
 
-    def _get_if_consistent(self, items):
+    def _get_if_consistent(self, items, nc):
 
         def _get_type(nc, item):
 
@@ -82,81 +122,131 @@ class CoreNetCDFDataModel(DataModel):
             IS_ATTRIBUTE: self._get_attrs
         }
 
-        with Dataset(self.path, 'r') as nc:
-            types = [_get_type(nc, item) for item in items]
+        types = [_get_type(nc, item) for item in items]
 
-        if types.count(types[0]) != len(types):
+        if len(set(types)) != 1:
             raise ValueError('Cannot mix variables and attributes')
 
-        return _map[types[0]](items)
+        return _map[types[0]](items, nc)
+
+    def _get_dtype(self, var):
+        """Returns the dtype a variable is returned as.
+
+        Floating point variables keep their on-disk precision, anything else
+        is promoted to float64 so that missing data can be given as NaN.
+        """
+        if np.issubdtype(var.dtype, np.floating):
+            return var.dtype
+        return np.float64
 
     def _get_freq(self, var):
-            try:
-                return var.shape[1]
-            except IndexError:
-                return 1
-
-    def _time_at(self, freq):
-        if self.time is None:
-            self._get_time()
-
-        time_start = num2date(self.time[0], units=self.time_units)
-        time_end = num2date(
-            self.time[-1] + 1,
-            units=self.time_units,
-            calendar=self.time_calendar
-        )
+        """Returns the frequency of var, cached by variable name."""
+        try:
+            return self._freq_cache[var.name]
+        except KeyError:
+            pass
+
+        freq = var.shape[1] if var.ndim > 1 else 1
+        self._freq_cache[var.name] = freq
+        return freq
 
+    def _time_at(self, freq, nc=None):
         try:
-            # Newer (?) versions of netCDF4 give datetimes from cftime._cftime
-            # We no want this. We call private method. Dave bad.
-            time_start = time_start._to_real_datetime()
-            time_end = time_end._to_real_datetime()
-        except AttributeError:
-            # Not dealing with cftime objects
+            return self._time_cache[freq]
+        except KeyError:
             pass
 
+        if self.time_start is None:
+            self._get_time(nc)
+
+        try:
+            step = _STEP_NS[freq]
+        except KeyError:
+            step = round(1e9 / freq)
+
+        # Time stamps from time_start up to, but excluding, time_end. Given
+        # the number of periods, date_range fills these in arithmetically,
+        # and the index keeps its frequency
+        n = (self.time_end - self.time_start) // step
         index = pd.date_range(
-            start=time_start,
-            end=time_end,
-            freq='{0:0.0f}ns'.format(1e9/freq)
+            start=pd.Timestamp(self.time_start),
+            periods=n,
+            freq=pd.offsets.Nano(step)
         )
 
-        return index[:-1]
-
-    def _get_time(self):
-        with Dataset(self.path, 'r') as nc:
-            self.time = nc['Time'][:].ravel()
-            self.time_units = nc['Time'].units
-            try:
-                self.time_calendar = nc['Time'].calendar
-            except AttributeError:
-                # At netCDF4 v1.5.7 this is the default calendar
-                self.time_calendar = 'standard'
+        self._time_cache[freq] = index
+        return index
+
+    @property
+    def time(self):
+        """Returns the Time variable of the file, read on first access."""
+        if self._time is None:
+            nc = self._open()
+            # Time is never missing, so skip netCDF4's masking and read it
+            # straight into a plain ndarray rather than a masked copy of it
+            nc['Time'].set_auto_mask(False)
+            self._time = nc['Time'][:].ravel()
+        return self._time
+
+    @time.setter
+    def time(self, time):
+        self._time = time
+
+    def _get_time(self, nc=None):
+        if nc is None:
+            nc = self._open()
+
+        # Only the first and last times are needed here, the full variable
+        # is read by the time property if it is asked for. Time is never
+        # missing, so skip netCDF4's masking.
+        nc['Time'].set_auto_mask(False)
+        _first, _last = nc['Time'][0], nc['Time'][-1]
+        self._time_cache = {}
+        self.time_units = nc['Time'].units
+        try:
+            self.time_calendar = nc['Time'].calendar
+        except AttributeError:
+            # At netCDF4 v1.5.7 this is the default calendar
+            self.time_calendar = 'standard'
+
+        # Only the start and (exclusive) end of the data are needed to build
+        # time indices, so convert these once, to integer ns since epoch.
+        # Going via isoformat works for both datetime and cftime objects.
+        _start, _end = num2date(
+            [_first, _last + 1],
+            units=self.time_units,
+            calendar=self.time_calendar
+        )
+        self.time_start, self.time_end = np.array(
+            [_start.isoformat(), _end.isoformat()], dtype='datetime64[ns]'
+        ).astype(np.int64)
 
     def __enter__(self):
-        self.handle = Dataset(self.path, 'r')
+        self.handle = self._open()
         return self.handle
 
     def __exit__(self, *args):
-        self.handle.close()
+        self.close()
         self.handle = None
 
     def _find_vars(self, filterby):
         _vars = {}
         _filter_attrs = ('long_name', 'standard_name')
-        with Dataset(self.path, 'r') as nc:
-            if not filterby:
-                return {i: nc[i].long_name for i in nc.variables}
-            for _var in nc.variables:
-                if re.search(filterby, _var, re.IGNORECASE):
-                    _vars[_var] = nc[_var].long_name
-                    continue
-                for _attr in _filter_attrs:
-                    if re.search(filterby, getattr(nc[_var], _attr, ''),
-                                 re.IGNORECASE):
-                        _vars[_var] = nc[_var].long_name
-                        continue
+        nc = self._open()
+        if not filterby:
+            return {i: nc[i].long_name for i in nc.variables}
+        # Multiline so that ^ and $ still anchor to each of the name
+        # and attributes joined below
+        pattern = re.compile(filterby, re.IGNORECASE | re.MULTILINE)
+        for _var in nc.variables:
+            # Read all of the attributes once, then search the variable
+            # name and attributes in one go
+            _attrs = nc[_var].__dict__
+            _text = '\n'.join(
+                [_var] + [_attrs.get(_attr, '') for _attr in _filter_attrs]
+            )
+            if pattern.search(_text):
+                _vars[_var] = _attrs['long_name']
         return _vars
 
     def find(self, what, filterby=None):
@@ -178,16 +268,16 @@ class CoreNetCDFDataModel(DataModel):
             return self[items]
 
         _ret_dict = {}
-        with Dataset(self.path, 'r') as nc:
-            if context not in nc.variables:
-                raise ValueError('Invalid context: {}'.format(context))
+        nc = self._open()
+        if context not in nc.variables:
+            raise ValueError('Invalid context: {}'.format(context))
 
-            if not items:
-                for attr in nc[context].ncattrs():
-                    _ret_dict[attr] = getattr(nc[context], attr)
-                return _ret_dict
+        if not items:
+            for attr in nc[context].ncattrs():
+                _ret_dict[attr] = getattr(nc[context], attr)
+            return _ret_dict
 
-            for item in items:
-                _ret_dict[item] = getattr(nc[context], item, None)
+        for item in items:
+            _ret_dict[item] = getattr(nc[context], item, None)
 
         return _ret_dict
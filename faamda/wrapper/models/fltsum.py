@@ -1,7 +1,7 @@
-import csv
+import os.path
 import re
-import datetime
 
+import numpy as np
 import pandas as pd
 
 from .abc import DataModel
@@ -33,6 +33,12 @@ class FltSumDataModel(DataModel):
 
 
     """
+    def __init__(self, path):
+        super().__init__(path)
+        self._events = None
+        self._events_mtime = None
+        self._event_bounds = None
+
     def __enter__(self):
         self.handle = open(self.path, 'r')
         return self.handle
@@ -59,10 +65,9 @@ class FltSumDataModel(DataModel):
     def to_df(self):
         """ Creates dataframe from list of dictionaries
         """
-        return pd.DataFrame.from_dict(
-                    {d_['start_time']:d_ for d_ in self.get()},
-                                      orient='index')#.set_index('start_time',
-                                                     #           inplace=True)
+        df = pd.DataFrame(self.get()).set_index('start_time', drop=False)
+        df.index.name = None
+        return df
 
 
     def _get(self):
@@ -80,41 +85,37 @@ class FltSumDataModel(DataModel):
             'stop_lon', 'comment'
         ]
 
-        ret_list = []
-        with open(self.path, 'r') as _csv:
-            reader = csv.DictReader(_csv, fieldnames=_fieldnames)
-            for row in reader:
-                ret_list.append(row)
-
-        for item in ret_list[1:]:
+        # Read everything as strings, the first line is the header
+        table = pd.read_csv(self.path, names=_fieldnames, header=0,
+                            dtype=str, keep_default_na=False)
+
+        # Times may be given to the second, minute or hour. Parse whole
+        # columns with each format in turn, any left unparsed are NaT.
+        for var in ('start_time', 'stop_time'):
+            _time = pd.Series(pd.NaT, index=table.index, dtype='datetime64[ns]')
+            for fmt in ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d %H'):
+                _time = _time.fillna(pd.to_datetime(table[var], format=fmt,
+                                                    errors='coerce'))
+            table[var] = _time
+
+        for var_t in ('start', 'stop'):
+            for var_o in ('hdg', 'height', 'lat', 'lon'):
+                var = '{}_{}'.format(var_t, var_o)
+                table[var] = pd.to_numeric(table[var],
+                                           errors='coerce').astype(float)
+
+        table = table.sort_values('start_time', kind='mergesort')
+
+        # Convert df to list of dictionaries, with missing values as None and
+        # times as datetime.datetime
+        ret_list = table.astype(object).where(table.notna(), None).to_dict(
+                                                            orient='records')
+        for item in ret_list:
             for var in ('start_time', 'stop_time'):
-                try:
-                    item[var] = datetime.datetime.strptime(
-                                            item[var], '%Y-%m-%d %H:%M:%S')
-                except KeyError as err:
-                    item[var] = None
-                    continue
-                except ValueError as err:
-                    try:
-                        item[var] = datetime.datetime.strptime(
-                                            item[var], '%Y-%m-%d %H:%M')
-                    except ValueError as err:
-                        try:
-                            item[var] = datetime.datetime.strptime(
-                                            item[var], '%Y-%m-%d %H')
-                        except Exception as err:
-                            item[var] = None
-                            continue
-
-            for var_t in ('start', 'stop'):
-                for var_o in ('hdg', 'height', 'lat', 'lon'):
-                    var = '{}_{}'.format(var_t, var_o)
-                    if not item[var]:
-                        item[var] = None
-                        continue
-                    item[var] = float(item[var])
+                if item[var] is not None:
+                    item[var] = item[var].to_pydatetime()
 
-        return sorted(ret_list[1:], key=lambda x: x['start_time'])
+        return ret_list
 
 
     def _get_txt(self, metarows=9, fltdate=None, **kwargs):
@@ -193,18 +194,32 @@ class FltSumDataModel(DataModel):
         if pd.isnull(date) == True:
             raise ValueError('Invalid date format given in flight summary.')
 
-        # Read the main tablulated data
+        # Read the main tablulated data, slicing each line at the fixed
+        # column positions. An end position of -1 is the end of the line.
         with open(self.path, 'r') as _txt:
-            table = pd.read_fwf(_txt,
-                skiprows=metarows,
-                names=[f for f,t in _fieldnames.items() if t != None],
-                colspecs=[t for t in _fieldnames.values() if t != None],
-                skipinitialspace=True,
-                index_col=False,
-                parse_dates=['start_time', 'stop_time'],
-                date_parser=lambda t: datetime.datetime.combine(
-                                date,
-                                pd.to_datetime(t, format='%H%M%S').time()))
+            lines = [l.rstrip('\n') for l in _txt.readlines()[metarows:]]
+        lines = [l for l in lines if l.strip()]
+
+        table = pd.DataFrame({
+            f: [l[t[0]:(None if t[1] == -1 else t[1])].strip() for l in lines]
+            for f, t in _fieldnames.items() if t != None})
+
+        # Convert any columns that are entirely numeric, blanks are NaN
+        for col in table:
+            if col in ('start_time', 'stop_time'):
+                continue
+            try:
+                table[col] = pd.to_numeric(table[col].replace('', np.nan))
+            except ValueError as err:
+                # Not a numeric column
+                pass
+
+        # Combine the hhmmss timestamps with the flight date
+        _date = pd.Timestamp(date)
+        for var in ('start_time', 'stop_time'):
+            _time = pd.to_datetime(table[var], format='%H%M%S',
+                                   errors='coerce')
+            table[var] = _date + (_time - _time.dt.normalize())
 
         # Convert 'comment' NaNs to empty strings
         table['comment'] = table['comment'].fillna('')
@@ -215,7 +230,8 @@ class FltSumDataModel(DataModel):
         ### required then do;
         ###     from collections import OrderedDict
         ###     ret_list = table.to_dict(orient='records', into=OrderedDict)
-        ret_list = table.to_dict(orient='records')
+        ret_list = table.astype(object).where(table.notna(), None).to_dict(
+                                                            orient='records')
 
         self.metadata = _metadata
 
@@ -265,13 +281,14 @@ class FltSumDataModel(DataModel):
             if pd.isna(_within):
                 raise TypeError(parse_err_msg('Timedelta',within))
 
-        def in_time(e):
-            if e['stop_time'] == None:
-                return abs(e['start_time'] - _time) <= _within
-            else:
-                return (e['start_time']-_within) <= _time <= (e['stop_time']+_within)
+        # Compare with all events at once. Events without a stop time are
+        # treated as ending when they start, so are found within
+        # the tolerance either side of their start time.
+        events = self.get()
+        starts, stops = self._event_bounds
+        in_time = ((starts - _within) <= _time) & (_time <= (stops + _within))
 
-        return [event for event in self.get() if in_time(event)]
+        return [events[i] for i in np.flatnonzero(in_time)]
 
 
     def _get_event_time(self, item):
@@ -297,8 +314,21 @@ class FltSumDataModel(DataModel):
     def get(self):
         """ Returns the flight summary as a list of dictionaries for each event
 
+        The file is only parsed again if it has been modified since the last
+        call. The events returned are copies, so may be changed by the caller
+        without changing those kept for later calls.
         """
-        return self._get()()
+        mtime = os.path.getmtime(self.path)
+        if self._events is None or mtime != self._events_mtime:
+            self._events = self._get()()
+            self._events_mtime = mtime
+
+            # Start and end times of all events for time searches
+            starts = pd.DatetimeIndex([e['start_time'] for e in self._events])
+            stops = pd.DatetimeIndex([e['stop_time'] for e in self._events])
+            self._event_bounds = (starts, stops.where(stops.notna(), starts))
+
+        return [dict(e) for e in self._events]
 
 
     def find(self, event):
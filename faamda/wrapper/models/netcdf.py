@@ -1,15 +1,26 @@
+import atexit
 import datetime
+import importlib.util
+import logging
 import os.path
 import re
+import threading
+
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from netCDF4 import Dataset
 
-import xarray as xr
+# xarray is slow to import so is imported in the functions that use it,
+# rather than whenever the models are imported
 
 from .abc import DataModel
 
 __all__ = ['NetCDFDataModel']
 
+logger = logging.getLogger(__name__)
+
 IS_ATTRIBUTE = 101
 IS_VARIABLE = 102
 IS_DIMENSION = 103
@@ -21,9 +32,188 @@ DIMENSION_STRINGS = ['dimension', 'dim', 'dimensions', 'dims']
 GROUP_STRINGS = ['group', 'grp', 'groups', 'grps']
 ROOT_STRINGS = ['', '/']
 
+# Sets of root group names, including None, and of wildcard items, for
+# membership tests
+_ROOT_SET = frozenset([None] + ROOT_STRINGS)
+_WILDCARDS = frozenset(['*', 'all', 'ALL'])
+
 # Variable attribute names to search when filtering by attribute
 SEARCH_ATTRS = ['long_name', 'standard_name', 'comment']
 
+# dask is optional, it is only needed if NetCDFDataModel.chunks is set
+_HAS_DASK = importlib.util.find_spec('dask') is not None
+
+# Read only netCDF4 handles kept open between calls, least recently used
+# first, along with the modification time of the file when it was opened.
+# Opening a file means re-reading the HDF5 superblock and metadata so
+# repeated finds/gets on the same file reuse the handle instead. Evicted
+# handles are only dropped, not closed, as xarray datasets returned from
+# earlier calls may still be reading from them. They are closed once those
+# are garbage collected.
+_HANDLE_CACHE_SIZE = 32
+_handles = OrderedDict()
+
+# Decoded xarray views of groups of the cached handles, by (path, group).
+# Decoding a group's variables and coordinates is repeated for every get,
+# so views are kept for as long as the handle they were made from. Only
+# copies of the views are handed out, so that callers cannot change the
+# views by changing what they get.
+_views = OrderedDict()
+
+# netCDF/HDF5 are not thread safe, so all access through the cached handles
+# is serialised with this lock. It is given to xarray too, which takes it
+# for each read it makes. Reentrant since xarray may read coordinate data
+# while a view is being created under the lock.
+_LOCK = threading.RLock()
+
+
+def _open_dataset(path):
+    """Returns a cached, open, read only netCDF4 Dataset of path.
+
+    The handle is reopened if the file has been modified since it was
+    opened.
+    """
+    mtime = os.path.getmtime(path)
+    with _LOCK:
+        try:
+            _mtime, nc = _handles[path]
+        except KeyError:
+            pass
+        else:
+            if nc.isopen() and _mtime == mtime:
+                _handles.move_to_end(path)
+                return nc
+            _forget(path)
+
+        nc = Dataset(path, 'r')
+        _handles[path] = (mtime, nc)
+        while len(_handles) > _HANDLE_CACHE_SIZE:
+            _forget(next(iter(_handles)))
+
+        return nc
+
+
+def _open_group(path, grp=None, nc=None, decode_cf=True):
+    """Returns an xarray view of group grp of the cached handle of path.
+
+    The view reads from the shared handle so must not be closed by the
+    caller. Views are cached with the handle, so a copy of the cached view
+    is returned, which the caller may modify. Variable data are not copied,
+    they are still read lazily, and each copy keeps those it reads to
+    itself. If the handle, nc, has already been obtained
+    with `_open_dataset()` then it may be given to save looking it up again.
+    If only names and attributes are needed then decode_cf may be False to
+    skip CF decoding (times, masking and scaling) of the variables.
+
+    Raises:
+        OSError if grp is not a group in path.
+    """
+    import xarray as xr
+
+    # The same group may be given with or without leading and trailing
+    # separators, as in `NetCDFDataModel._uniq_grps()`, and is only cached once
+    grp = grp.strip('/') or None if grp else None
+
+    with _LOCK:
+        if nc is None:
+            nc = _open_dataset(path)
+        key = (path, grp, decode_cf)
+        try:
+            _nc, ds = _views[key]
+        except KeyError:
+            pass
+        else:
+            if _nc is nc:
+                return _copy_view(ds)
+
+        store = xr.backends.NetCDF4DataStore(nc, group=grp, mode='r',
+                                             lock=_LOCK)
+        ds = xr.open_dataset(store, decode_cf=decode_cf)
+        _views[key] = (nc, ds)
+        return _copy_view(ds)
+
+
+def _copy_view(ds):
+    """Returns a copy of view ds that shares nothing with it but lazy data.
+
+    A deep copy so that attribute values are not shared, which only rewraps
+    lazily loaded data. Index coordinates are copied again as xarray builds
+    those of a copy from the indexes of ds.
+    """
+    _ds = ds.copy(deep=True)
+    _ds = _ds.assign_coords(
+        {k: _ds[k].variable.copy(deep=True) for k in _ds.xindexes}
+    )
+
+    # assign_coords moves the coordinates to the end, put them back
+    return _ds[list(ds.variables)]
+
+
+@lru_cache(maxsize=_HANDLE_CACHE_SIZE)
+def _catalog(path, mtime):
+    """Returns names of everything in every group of path, read in one pass.
+
+    The file modification time, mtime, is only used as part of the cache key
+    so that changed files are re-read.
+
+    Returns:
+        Dictionary of group path:(attributes, variables, dimensions, groups)
+        pairs, each a frozenset of the names found in that group. The root
+        group path is '/'.
+    """
+    catalog = {}
+    with _LOCK:
+        stack = [_open_dataset(path)]
+        while stack:
+            ds = stack.pop()
+            catalog[ds.path] = (frozenset(ds.ncattrs()),
+                                frozenset(ds.variables),
+                                frozenset(ds.dimensions),
+                                frozenset(ds.groups))
+            stack.extend(ds.groups.values())
+
+    return catalog
+
+
+def _schema(path, mtime, grp=None):
+    """Returns names of attributes, variables, dimensions and groups in grp.
+
+    Returns:
+        Tuple of (attributes, variables, dimensions, groups), each a
+        frozenset of the names found in group grp of path.
+
+    Raises:
+        IndexError if group grp not found in path.
+    """
+    key = '/' if grp in _ROOT_SET else '/' + grp.strip('/')
+    try:
+        return _catalog(path, mtime)[key]
+    except KeyError:
+        raise IndexError('{} not found in {}'.format(grp, path)) from None
+
+
+def _forget(path):
+    """Drops the cached handle and views of path without closing them."""
+    _handles.pop(path, None)
+    for key in [k for k in _views if k[0] == path]:
+        del _views[key]
+
+
+def _close_dataset(path):
+    """Closes and forgets the cached handle of path, if there is one."""
+    with _LOCK:
+        _mtime, nc = _handles.get(path, (None, None))
+        _forget(path)
+        if nc is not None and nc.isopen():
+            nc.close()
+
+
+@atexit.register
+def _close_all():
+    """Closes all cached handles."""
+    for path in list(_handles):
+        _close_dataset(path)
+
 
 class NetCDFDataModel(DataModel):
     """Returns requested data or metadata from path
@@ -31,19 +221,62 @@ class NetCDFDataModel(DataModel):
     Generalised netCDF model which will handle netCDF4 files with groups.
     Default format is xr.Dataset as these will contain all group and
     variable attributes.
+
+    Args:
+        path (:obj:`str`): Path of the netCDF file.
+        n_jobs (:obj:`int`): Number of threads used to read variables and
+            groups when items from more than one group are requested. The
+            default of 1 reads each group in turn, -1 uses as many threads
+            as the executor allows.
+        chunks (:obj:`int`, :obj:`dict` or :obj:`str`): If not None then
+            variables and groups returned by `get()` are dask arrays with
+            these chunks, as given to `xr.Dataset.chunk()`, and are only read
+            when computed. Default is None, in which case variables are
+            read when first accessed. Ignored if dask is not installed.
     """
 
+    options = ('n_jobs', 'chunks')
+
+    def __init__(self, path, n_jobs=1, chunks=None):
+        super().__init__(path)
+        self.n_jobs = n_jobs
+        self.chunks = chunks
+        # Group paths found by _find_grps, by grp, with file mtime
+        self._grps_cache = {}
+
     def __enter__(self):
-        self.handle = Dataset(self.path, 'r')
+        # Pin the cached handle so that all finds and gets within the
+        # context use it, without looking it up for each call
+        self.handle = _open_dataset(self.path)
         return self.handle
 
     def __exit__(self, *args):
-        self.handle.close()
+        # The handle is left open in the cache for other users of the file,
+        # use `self.close()` to drop it
         self.handle = None
+        self._grps_cache = {}
 
     def __getitem__(self, item):
         return self.get(item, squeeze=True)
 
+    def close(self):
+        """Drops any cached handle of the file.
+
+        The handle is shared with other models of the file and with the
+        datasets returned by them, so it is not closed here but once none of
+        those use it anymore. Datasets returned earlier can still be read.
+        """
+        with _LOCK:
+            _forget(self.path)
+        self.handle = None
+        self._grps_cache = {}
+
+    def _open(self):
+        """Returns the pinned handle if in a context, else the cached one."""
+        if self.handle is not None and self.handle.isopen():
+            return self.handle
+        return _open_dataset(self.path)
+
 
     @staticmethod
     def _uniq_grps(strs):
@@ -56,89 +289,110 @@ class NetCDFDataModel(DataModel):
             strs (:obj:list of `str`): List of strings to obtain paths from.
 
         Returns:
-            grps_uniq (:obj:`list`): Sorted list of unique group paths. If
-                root group then returns path ''.
+            grps_uniq (:obj:`list`): List of unique group paths, in the order
+                they first appear in strs. If root group then returns path
+                ''.
             grps_strs (:obj:`list`): List of lists of strs' basenames
                 associated with each group in grps_unique.
         """
 
         if type(strs) in [str]:
-            strs = [strs[::]]
+            strs = [strs]
 
-        # Get list of unique groups.
-        _grps, _strs = zip(*sorted([os.path.split(s_) for s_ in strs],
-                                    key=lambda g: g[0]))
-        _grps = [g.replace('/','') for g in _grps[::]]
+        # Bucket basenames by group in a single pass. Only leading/trailing
+        # separators are stripped so that nested paths remain valid groups.
+        _grps = defaultdict(list)
+        for s_ in strs:
+            _grp, _, _str = s_.rpartition('/')
+            _grps[_grp.strip('/')].append(_str)
 
-        # Create ordered, unique list of group names
-        grps_uniq = list(dict.fromkeys(_grps))
-        grps_strs = [[_strs[i] for i,x in enumerate(_grps)  if x==y]
-                     for y in grps_uniq]
+        # Unique group names, in order of first appearance
+        grps_uniq = list(_grps)
+        grps_strs = list(_grps.values())
 
         return grps_uniq, grps_strs
 
 
-    def _parent_coords(self, items, grp=None):
+    def _parent_coords(self, items, grp=None, nc=None, decode_cf=True,
+                       needed=None):
         """ Finds coordinates of items in parent group/s
 
-        .. NOTE::
-            It would probably be faster to have this as a @staticmethod and
-            pass it the netCDF4 dataset. Then not re-opening file. However
-            are netCDF4 coords compatable with xr.Coordinates?
-
         Args:
             items (:obj:`list`): List of variable strings to read. The
                 variable strings should have all path information removed
                 and all be from the same group, grp.
             grp (:obj:`str`): Path to single group, default is None which
                 is the file root. Strings in `ROOT_STRINGS` are not accepted.
+            nc (:obj:`netCDF4.Dataset`): Open handle of the file, default
+                is None in which case the cached handle is used.
+            decode_cf (:obj:`bool`): If True [default] then coordinates are
+                CF decoded, should be the same as for items.
+            needed (:obj:`set`): Names of the dimensions of items without a
+                coordinate in grp. Default is None in which case these are
+                found from items. The search stops once all are found.
 
         Returns:
             Dataset of coordinates. Should be merged in calling method. There
             probably should be some catch for if the wrong coords are found?
         """
-        if grp in ROOT_STRINGS:
+        if nc is None:
+            nc = self._open()
+
+        if grp in _ROOT_SET:
             grp = None
         try:
-            ds = xr.open_dataset(self.path, group=grp)
+            ds = _open_group(self.path, grp, nc, decode_cf)
         except OSError as err:
             # Generally because grp is not a valid file group
-            print(err.errno)
+            logger.debug('Cannot open group %s', grp, exc_info=err)
             return None
 
-        with ds:
-            # Initialise coords dataset with any coordinates that exist
-            # Compare with those required for items
-            # Coordinate obj do not contain variable attributes. However,
-            # since this is initialising the coords, these coordinates are
-            # already contained in the dataset and so have all of their attr
-            coords_req = ds.coords
-            dims_req = ds[items].dims
-
-        while len(coords_req) < len(dims_req):
+        # Initialise coords dataset with any coordinates that exist
+        # Compare with those required for items
+        # Coordinate obj do not contain variable attributes. However,
+        # since this is initialising the coords, these coordinates are
+        # already contained in the dataset and so have all of their attr
+        coords_req = ds.coords
+
+        # The dimensions, and their sizes, required for items are read from
+        # the netCDF4 variables rather than from a subset of ds. Parents are
+        # found from the netCDF4 groups, and only those with a variable
+        # named as a required dimension are opened with xarray
+        dims_req = {}
+        with _LOCK:
+            _ncgrp = nc[grp] if grp else nc
+            for item in items:
+                for dim in _ncgrp.variables[item].get_dims():
+                    dims_req[dim.name] = dim.size
+
+        # Dimensions still without a coordinate. Comparing the numbers of
+        # coords and dims is not enough as grp may have coordinates that are
+        # not dimensions of items
+        if needed is None:
+            needed = dims_req
+        needed = set(needed) - set(coords_req)
+
+        while needed:
             # Step up one level in path
-            try:
-                grp = os.path.split(grp)[0]
-            except TypeError as err:
-                # Because grp is None
+            _ncgrp = _ncgrp.parent
+            if _ncgrp is None:
+                # Already at the file root
                 break
 
-            if grp in ROOT_STRINGS:
-                grp = None
-            try:
-                ds = xr.open_dataset(self.path, group=grp)
-            except OSError as err:
-                # Generally because grp is not a valid file group
-                print(err.errno)
-            else:
-                with ds:
-                    # Add coordinate that is the same name and length as that
-                    # required and is not already in coords_req
-                    _coords = ds[[v for v in ds.coords
-                                  if (v in dims_req and
-                                      len(ds[v]) == dims_req[v] and
-                                      v not in coords_req)]]
-                    coords_req = coords_req.merge(_coords)
+            with _LOCK:
+                _vars = [v for v in dims_req
+                         if v in needed and v in _ncgrp.variables]
+            if not _vars:
+                continue
+
+            ds = _open_group(self.path, _ncgrp.path, nc, decode_cf)
+
+            # Add coordinate that is the same name and length as that
+            # required and is not already in coords_req
+            _found = [v for v in _vars
+                      if v in ds.coords and len(ds[v]) == dims_req[v]]
+            coords_req = coords_req.merge(ds[_found])
+            needed.difference_update(_found)
 
         return coords_req
 
@@ -147,6 +401,15 @@ class NetCDFDataModel(DataModel):
         """ Returns list of attribute names.
 
         """
+        if not filterby:
+            # Only names needed so these come from the cached schema
+            if grp in _ROOT_SET:
+                grp = ''
+            attrs = _schema(self.path, os.path.getmtime(self.path), grp)[0]
+            wildcard = not _WILDCARDS.isdisjoint(items)
+            return sorted(os.path.join(grp,a) for a in attrs
+                          if wildcard or a in items)
+
         d = self._get_attrs(items, grp, filterby)
         if d is None:
             return None
@@ -155,7 +418,7 @@ class NetCDFDataModel(DataModel):
         return sorted(d.keys())
 
 
-    def _get_attrs(self, items, grp=None, filterby=None):
+    def _get_attrs(self, items, grp=None, filterby=None, nc=None):
         """Returns filtered attributes in group.
 
         This is designed for root/group attributes. If variable attributes are
@@ -172,6 +435,8 @@ class NetCDFDataModel(DataModel):
             filterby (:obj:`str`): String to filter the items by. Attributes
                 are filtered by searching for `filterby` in the attribute
                 name/s as well as the contents of the attributes.
+            nc (:obj:`netCDF4.Dataset`): Open handle of the file, default
+                is None in which case the cached handle is used.
 
         Returns:
             Dictionary of all attribute key:value pairs found or {}.
@@ -180,34 +445,37 @@ class NetCDFDataModel(DataModel):
             IndexError if group grp not found in dataset.
 
         """
-        with Dataset(self.path, 'r') as _ds:
-            if grp in [None]+ROOT_STRINGS:
-                ds = _ds
-                grp = ''
-            else:
-                try:
-                    ds = _ds[grp]
-                except IndexError as err:
-                    # Group grp not in _ds
-                    raise
-
-            if not set(['*','all','ALL']).isdisjoint(items):
-                # If wildcard found in items then return all attributes in grp
-                rattr = {os.path.join(grp,a):v for a,v in ds.__dict__.items()}
-            else:
-                # Return items that are an attribute in group
-                rattr = {os.path.join(grp,a):v for a,v in ds.__dict__.items()
-                         if a in items}
-
-        if filterby:
-            # Search attribute name and contents for filterby string and remove
-            # any items in rattr that do not match
-            d_keys = [k for k,v in rattr.items()
-                      if re.search(filterby,
-                                   '{} {}'.format(k,v),
-                                   re.IGNORECASE) == None]
-            for k in d_keys:
-                rattr.pop(k)
+        _ds = nc if nc is not None else self._open()
+        if grp in _ROOT_SET:
+            ds = _ds
+            grp = ''
+        else:
+            try:
+                ds = _ds[grp]
+            except IndexError as err:
+                # Group grp not in _ds
+                raise
+
+        # If wildcard found in items then return all attributes in grp,
+        # otherwise return items that are an attribute in group
+        wildcard = not _WILDCARDS.isdisjoint(items)
+        pattern = re.compile(filterby, re.IGNORECASE) if filterby else None
+
+        if wildcard:
+            _attrs = ds.__dict__.items()
+        else:
+            # Only look up the named attributes rather than reading them all
+            _ncattrs = set(ds.ncattrs())
+            _attrs = [(a, ds.getncattr(a)) for a in dict.fromkeys(items)
+                      if a in _ncattrs]
+
+        rattr = {}
+        for a, v in _attrs:
+            k = os.path.join(grp,a)
+            # Search attribute name and contents for filterby string
+            if pattern and pattern.search('{} {}'.format(k,v)) == None:
+                continue
+            rattr[k] = v
 
         return rattr
 
@@ -252,7 +520,7 @@ class NetCDFDataModel(DataModel):
         #     return grpvar_func(dims_l)
 
 
-    def _get_dims(self, grp=None, filterby=None):
+    def _get_dims(self, items, grp=None, filterby=None, nc=None):
 
         pass
 
@@ -262,28 +530,44 @@ class NetCDFDataModel(DataModel):
 
         http://unidata.github.io/netcdf4-python/netCDF4/index.html#section2
 
-        Args are ignored.
+        Args:
+            grp (:obj:`str`): Path to single group, default is None which
+                is the file root. Only grp and the groups below it are
+                returned.
+            filterby: Ignored.
 
         Returns:
-            List of group paths starting with the root, '/'.
+            List of group paths starting with grp, or the root '/'.
+
+        Raises:
+            IndexError if group grp not found in dataset.
         """
-        def walktree(top):
-            values = top.groups.values()
-            yield values
-            for value in top.groups.values():
-                for children in walktree(value):
-                    yield children
+        if grp in _ROOT_SET:
+            top = '/'
+        else:
+            top = '/' + grp.strip('/')
 
-        grps_list = ['/']
-        with Dataset(self.path, 'r') as nc:
-            for children in walktree(nc):
-                for child in children:
-                    grps_list.append(child.path)
+        # The group tree does not change unless the file does
+        mtime = os.path.getmtime(self.path)
+        try:
+            _mtime, grps_list = self._grps_cache[top]
+        except KeyError:
+            pass
+        else:
+            if _mtime == mtime:
+                return list(grps_list)
 
-        return sorted(grps_list)
+        # Every group path is in the catalog, raise IndexError if top is not
+        _schema(self.path, mtime, top)
+        _prefix = top.rstrip('/') + '/'
+        grps_list = [g for g in _catalog(self.path, mtime)
+                     if g == top or g.startswith(_prefix)]
+        grps_list.sort()
+        self._grps_cache[top] = (mtime, grps_list)
+        return list(grps_list)
 
 
-    def _get_grps(self, items, grp=None, filterby=None):
+    def _get_grps(self, items, grp=None, filterby=None, nc=None):
         """Returns dictionary of datasets associated with each group in grp.
 
         Args:
@@ -295,65 +579,77 @@ class NetCDFDataModel(DataModel):
                 is the file root. Strings in `ROOT_STRINGS` are not accepted.
             filterby (:obj:`str`): String to filter the items by. Groups
                 are filtered by searching for `filterby` in the group name/s.
+            nc (:obj:`netCDF4.Dataset`): Open handle of the file, default
+                is None in which case the cached handle is used.
 
         Returns:
             Dictionary of group:dataset pairs, one for each group found or
-            an empty dictionary if no groups found.
+            an empty dictionary if no groups found. The data of variables
+            are only read when they are used, call `.load()` on a dataset
+            to read it all into memory.
 
         Raises:
             IndexError if group grp not found in dataset.
         """
-        with Dataset(self.path, 'r') as _ds:
-            if grp in [None]+ROOT_STRINGS:
-                ds = _ds
-                grp = ''
-            else:
-                try:
-                    ds = _ds[grp]
-                except IndexError as err:
-                    # Group grp not in _ds
-                    raise
-
-            if not set(['*','all','ALL']).isdisjoint(items):
-                items = list(ds.groups.keys())
-
-            if filterby:
-                _grps = [ds[g].path for g in items
-                         if (g in ds.groups and re.search(filterby,
-                                                         g,
-                                                         re.IGNORECASE)!=None)]
-            else:
-                _grps = [ds[g].path for g in items if g in ds.groups]
+        import xarray as xr
 
-        rd = {}
-        for _grp in _grps:
-            _rds = xr.load_dataset(self.path, group=os.path.basename(_grp))
-            _rds_coords = self._parent_coords(list(_rds.keys()), _grp)
-            rd[_grp] = xr.merge([_rds,_rds_coords])
+        _ds = nc if nc is not None else self._open()
+        if grp in _ROOT_SET:
+            ds = _ds
+            grp = ''
+        else:
+            try:
+                ds = _ds[grp]
+            except IndexError as err:
+                # Group grp not in _ds
+                raise
 
-        return rd
+        if not _WILDCARDS.isdisjoint(items):
+            items = list(ds.groups.keys())
+
+        if filterby:
+            pattern = re.compile(filterby, re.IGNORECASE)
+            _grps = [ds[g].path for g in items
+                     if (g in ds.groups and pattern.search(g)!=None)]
+        else:
+            _grps = [ds[g].path for g in items if g in ds.groups]
+
+        def _read(_grp):
+            # Variables are left lazy, they are read when first used
+            _rds = self._chunk(_open_group(self.path, _grp, _ds))
+            _rds_coords = self._parent_coords(list(_rds.keys()), _grp, _ds)
+            return xr.merge([_rds,_rds_coords])
+
+        # Groups are read in threads if n_jobs is set, see `self.get()`
+        return dict(zip(_grps, self._map_jobs(_read, _grps)))
 
 
     def _find_vars(self, items, grp=None, filterby=None):
         """ Returns dictionary of variable name:variable description pairs.
 
         """
-        ds = self._get_vars(items, grp, filterby)
+        # Only names and attributes are needed so skip decoding
+        ds = self._get_vars(items, grp, filterby, decode_cf=False)
         if ds is None:
             return {}
 
         # If ds empty then returns {}.
-        # Search for standard variable description attributes. If none
-        # found then add 'no description' dummy string to dict of var names
-        search_attr = lambda n: [a if a in ds[n].attrs else 'fred'
-                                 for a in SEARCH_ATTRS][0]
-        v = {os.path.join(grp,n):ds[n].attrs.get(search_attr(n),
-                                                 'no description') for n in ds}
+        # Use the first of the standard variable description attributes
+        # found. If none found then add 'no description' dummy string to dict
+        # of var names
+        def _pick(attrs):
+            for a in SEARCH_ATTRS:
+                if a in attrs:
+                    return attrs[a]
+            return 'no description'
+
+        v = {os.path.join(grp,n):_pick(ds[n].attrs) for n in ds}
 
         return v
 
 
-    def _get_vars(self, items, grp=None, filterby=None):
+    def _get_vars(self, items, grp=None, filterby=None, nc=None,
+                  decode_cf=True):
         """Returns sub-dataset containing filtered data variables in group.
 
         Args:
@@ -367,6 +663,11 @@ class NetCDFDataModel(DataModel):
                 are filtered by searching for `filterby` in the contents of
                 variable attributes in SEARCH_ATTRS as well as the variable
                 name itself.
+            nc (:obj:`netCDF4.Dataset`): Open handle of the file, default
+                is None in which case the cached handle is used.
+            decode_cf (:obj:`bool`): If True [default] then variables are CF
+                decoded. If False then variables and their attributes are as
+                they are in the file.
 
         Returns:
             Dataset of all variables found or an empty dataset if no
@@ -379,48 +680,55 @@ class NetCDFDataModel(DataModel):
             Should netCDF4 and xr group errors be made consistent? Currently
             IndexError from netCDF4 and OSError from xarray.
         """
+        import xarray as xr
+
+        if nc is None:
+            nc = self._open()
         try:
-            ds = xr.open_dataset(self.path, group=grp)
+            ds = _open_group(self.path, grp, nc, decode_cf)
         except OSError as err:
             # Generally because grp is not a valid file group
             raise
 
-        with ds:
-            # If wildcard found in items then make items a list of all vars
-            if not set(['*','all','ALL']).isdisjoint(items):
-                items = list(ds.data_vars.keys())
+        # If wildcard found in items then make items a list of all vars
+        if not _WILDCARDS.isdisjoint(items):
+            items = list(ds.data_vars.keys())
 
-            if filterby == None:
-                rds = ds[[v for v in items if v in ds]]
-            else:
-                # Filter variables by long_name, standard_name and variable name
-                attr_filter = lambda v: v != None and filterby.lower() in v.lower()
-
-                # .. TODO:: I can't get the below to go at the moment
-                # rds_ls = [ds[[v for v in items
-                #              if (v in ds and filterby.lower() in v.lower())]]]
-                # for attr in SEARCH_ATTRS:
-                #     rds_ls.append(ds.filter_by_attrs(eval(attr) = attr_filter))
-
-                rds_ln = ds.filter_by_attrs(long_name = attr_filter)
-                rds_sn = ds.filter_by_attrs(standard_name = attr_filter)
-                rds_c  = ds.filter_by_attrs(comment = attr_filter)
-                rds_vn = ds[[v for v in items
-                             if (v in ds and re.search(filterby,
-                                                       v,
-                                                       re.IGNORECASE)!=None)]]
-
-                # This is not designed to merge different datasets so insist
-                # on 'identical' variables if sub-datasets overlap.
-                rds = xr.merge([rds_ln, rds_sn, rds_c, rds_vn],
-                               compat='identical')
+        if filterby == None:
+            rds = ds[[v for v in items if v in ds]]
+        else:
+            # Filter variables by the attributes in SEARCH_ATTRS, on any
+            # data variable, and by the variable name, on items only. Each
+            # variable is checked once so that no merge of sub-datasets is
+            # needed.
+            _filterby = filterby.lower()
+            pattern = re.compile(filterby, re.IGNORECASE)
+            _items = set(items)
+
+            keep = []
+            for v in ds.data_vars:
+                if v in _items and pattern.search(v) != None:
+                    keep.append(v)
+                    continue
+                attrs = ds[v].attrs
+                for attr in SEARCH_ATTRS:
+                    val = attrs.get(attr)
+                    if val != None and _filterby in val.lower():
+                        keep.append(v)
+                        break
+
+            rds = ds[keep]
 
         if len(rds.coords) == 0 and len(rds.data_vars) == 0:
             return xr.Dataset()
 
-        if set(rds.coords) != set(rds.dims):
+        # Dimensions without a coordinate in grp. The root has no parents
+        # to look in.
+        missing = set(rds.dims) - set(rds.coords)
+        if missing and grp not in _ROOT_SET:
             # Some coordinates are in a parent group so need to find
-            rds_coords = self._parent_coords(list(rds), grp)
+            rds_coords = self._parent_coords(list(rds), grp, nc, decode_cf,
+                                             needed=missing)
             try:
                 rds = xr.merge([rds,rds_coords])
             except TypeError as err:
@@ -433,9 +741,23 @@ class NetCDFDataModel(DataModel):
                 #               'No internal error checking is done.')
                 rds.update(rds_coords)
 
+        if decode_cf:
+            # Undecoded variables are only used for their metadata
+            rds = self._chunk(rds)
+
         return rds
 
 
+    def _chunk(self, ds):
+        """Returns ds with dask arrays with `self.chunks`, if chunked."""
+        if self.chunks is None:
+            return ds
+        if not _HAS_DASK:
+            logger.debug('dask not installed, chunks %s ignored', self.chunks)
+            return ds
+        return ds.chunk(self.chunks)
+
+
     def find(self, what, grp=None, filterby=None):
         """Finds requested features in file and returns names of those found
 
@@ -470,7 +792,7 @@ class NetCDFDataModel(DataModel):
             List of variable, attribute, or group names or [] if nothing found.
 
         """
-        if grp in [None]+ROOT_STRINGS:
+        if grp in _ROOT_SET:
             _grp, _what = self._uniq_grps(what)
         else:
             _grp, _what = self._uniq_grps(os.path.join(grp,what))
@@ -485,7 +807,7 @@ class NetCDFDataModel(DataModel):
             return self._find_attrs('*', grp, filterby)
 
         elif what.lower() in GROUP_STRINGS:
-            return self._find_grps()
+            return self._find_grps(grp)
 
         elif what.lower() in DIMENSION_STRINGS:
             raise NotImplementedError
@@ -568,32 +890,35 @@ class NetCDFDataModel(DataModel):
             {'institution': 'FAAM'}
 
         """
+        import xarray as xr
+
         # Map item type to appropriate getter
         _map = {IS_VARIABLE: self._get_vars,
                 IS_ATTRIBUTE: self._get_attrs,
                 IS_GROUP: self._get_grps,
                 IS_DIMENSION: self._get_dims}
 
-        if grp in [None]+ROOT_STRINGS:
+        if grp in _ROOT_SET:
             grp = ''
 
         if type(items) in [str]:
-            items = [os.path.join(grp, items[::])]
+            items = [os.path.join(grp, items)]
         else:
-            items = [os.path.join(grp, i) for i in items[::]]
+            items = [os.path.join(grp, i) for i in items]
 
         grps, grp_items = self._uniq_grps(items)
 
-        def _get_type(nc, item):
-            if item.lower() in ['*','all']:
+        def _get_type(schema, item):
+            attrs, variables, dimensions, groups = schema
+            if item.lower() in _WILDCARDS:
                 return IS_VARIABLE
-            if item in nc.variables:
+            if item in variables:
                 return IS_VARIABLE
-            if item in nc.ncattrs():
+            if item in attrs:
                 return IS_ATTRIBUTE
-            if item in nc.dimensions:
+            if item in dimensions:
                 return IS_DIMENSION
-            if item in nc.groups:
+            if item in groups:
                 return IS_GROUP
 
             raise KeyError('{} not found'.format(item))
@@ -602,36 +927,52 @@ class NetCDFDataModel(DataModel):
         # within a single group
         grp_types = []
 
-        with Dataset(self.path, 'r') as _ds:
-            for _grp, _items in zip(grps, grp_items):
-                if _grp == '':
-                    ds = _ds
-                else:
-                    try:
-                        ds = _ds[_grp]
-                    except IndexError as err:
-                        # grp does not exist in _ds. Probably want a better
-                        # way of dealing with multi-group items.
-                        raise
-
-                types = [_get_type(ds, item) for item in _items]
-                if types.count(types[0]) != len(types):
-                    # Mixed types in single group. Probably want a better
-                    # way of dealing with multi-group items.
-                    raise ValueError('Cannot mix variables and attributes')
-
-                grp_types.append(types[0])
+        # The handle is looked up once here and given to each getter
+        nc = self._open()
+        mtime = os.path.getmtime(self.path)
+        for _grp, _items in zip(grps, grp_items):
+            try:
+                schema = _schema(self.path, mtime, _grp)
+            except IndexError as err:
+                # grp does not exist in file. Probably want a better
+                # way of dealing with multi-group items.
+                raise
+
+            types = [_get_type(schema, item) for item in _items]
+            if len(set(types)) != 1:
+                # Mixed types in single group. Probably want a better
+                # way of dealing with multi-group items.
+                raise ValueError('Cannot mix variables and attributes')
+
+            grp_types.append(types[0])
+
+        # Variables and groups are read through xarray, which serialises
+        # access to the netCDF/HDF5 libraries with _LOCK, so these may be
+        # read in threads. Attributes are read directly with netCDF4 and so
+        # are always read here.
+        _threaded = [i for i, _type in enumerate(grp_types)
+                     if _type in [IS_VARIABLE, IS_GROUP]]
+        _read = lambda i: _map[grp_types[i]](grp_items[i], grps[i], filterby,
+                                             nc)
+        _vals = dict(zip(_threaded, self._map_jobs(_read, _threaded)))
 
         # Loop through each group and return item values
         rd = {}
-        for _grp, _items, _type in zip(grps, grp_items, grp_types):
-            rd[os.path.join('/',_grp)] = _map[_type](_items, _grp, filterby)
+        for i, (_grp, _items, _type) in enumerate(zip(grps, grp_items,
+                                                      grp_types)):
+            _key = os.path.join('/',_grp)
+            if i in _vals:
+                rd[_key] = _vals[i]
+            else:
+                rd[_key] = _map[_type](_items, _grp, filterby, nc)
 
             if fmt == None or fmt.lower() in ['xr','xarray']:
                 pass
             elif fmt.lower() in ['pd','pandas']:
-                # Some error checking required?
-                rd[_grp] = rd[_grp].to_dataframe()
+                # Only datasets of variables can be converted, attributes are
+                # left as they are
+                if isinstance(rd[_key], xr.Dataset):
+                    rd[_key] = rd[_key].to_dataframe()
             elif fmt.lower() in ['np','numpy']:
                 raise NotImplementedError
 
@@ -641,6 +982,24 @@ class NetCDFDataModel(DataModel):
         return rd
 
 
+    def _map_jobs(self, func, args):
+        """Returns list of func applied to each of args, threaded if n_jobs.
+
+        Args:
+            func (:obj:`callable`): Function of a single argument.
+            args (:obj:`list`): Arguments to call func with.
+
+        Returns:
+            List of the results of func in the same order as args.
+        """
+        if self.n_jobs in [None, 0, 1] or len(args) < 2:
+            return [func(a) for a in args]
+
+        workers = None if self.n_jobs < 0 else self.n_jobs
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(func, args))
+
+
     def _get_time(self,grp=None):
         """Sets self.time property based on time coordinate of dataset group
 
@@ -650,23 +1009,56 @@ class NetCDFDataModel(DataModel):
                 returns time coord of grp. Default is None.
 
         """
+        _time = self.time_of(grp)
+        if _time is not None:
+            self.time = _time
+
+
+    def time_of(self, grp=None):
+        """Returns time coordinate of dataset group
+
+        Unlike `self.time` this does not change the stored time coordinate.
+
+        Args:
+            grp (:obj:`str`): Path to single group within the nc file. If grp
+                in [None,'','/'] then returns time coordinate of root otherwise
+                returns time coord of grp. Default is None.
+
+        Returns:
+            DataArray of the time coordinate or None if grp is not found.
+        """
 
-        if grp in [None,'','/']:
+        if grp in _ROOT_SET:
             grp = None
 
         try:
-            ds = xr.open_dataset(self.path,group=grp)
+            ds = _open_group(self.path, grp, self._open())
         except OSError as err:
             # Generally because grp is not a valid file group
-            print(err.errno)
-            #self.time = None # or leave undefined?
-        else:
-            with ds:
-                # Will only return time/Time if it is a coordinate variable
-                time_var = [v for v in ds.coords if 'time' in v.lower()]
+            logger.debug('Cannot open group %s', grp, exc_info=err)
+            return None
+
+        # Will only return time/Time if it is a coordinate variable
+        time_var = [v for v in ds.coords if 'time' in v.lower()]
+
+        # What to do if there is more than one? Is this possible?
+        return ds[time_var[0]]
+
+
+    @property
+    def time(self):
+        """Time coordinate of the file root, read on first access.
+
+        If `self._get_time()` has been called with a group then this is the
+        time coordinate of that group.
+        """
+        if self._time is None:
+            self._get_time()
+        return self._time
 
-                # What to do if there is more than one? Is this possible?
-                self.time = ds[time_var[0]]
+    @time.setter
+    def time(self, time):
+        self._time = time
 
 
     @property
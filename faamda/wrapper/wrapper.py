@@ -1,37 +1,95 @@
-import abc
 import datetime
 import os
 import re
-import threading
-import time
-import warnings
-import webbrowser
 
-import matplotlib.pyplot as plt
-import numpy as np
-import pandas as pd
-from netCDF4 import Dataset, num2date
+from concurrent.futures import ThreadPoolExecutor
 
 from .accessors import reg_accessors
 
 FULL_FREQ = 101
 
+
+def _combine_regexes(rexes):
+    """Returns one regex matching any of rexes, or None if they cannot be.
+
+    Each regex becomes the group _h<i> of an alternation, where i is its
+    position in rexes, so that the name of the last group of a match tells
+    which regex matched. Alternatives are tried in order, so for regexes
+    anchored at the start of the string this is the first of rexes that
+    matches. Named groups are made non-capturing as names are repeated
+    between the regexes, so the regex that matched must be used again to
+    obtain them.
+    """
+    rexes = list(rexes)
+    if not rexes:
+        return None
+
+    flags = rexes[0].flags
+    if any(r.flags != flags or not r.pattern.startswith('^') for r in rexes):
+        # The first match in the string may not be from the first regex
+        return None
+
+    patterns = [re.sub(r'\(\?P<\w+>', '(?:', r.pattern) for r in rexes]
+    try:
+        return re.compile(
+            '|'.join('(?P<_h{}>{})'.format(i, p) for i, p in enumerate(patterns)),
+            flags
+        )
+    except re.error:
+        return None
+
+
+def _is_visible(name):
+    """Default directory filter of FAAM, skips hidden directories."""
+    return not name.startswith('.')
+
+
+def _scan_dir(root, dir_filter=None):
+    """Returns lists of file entries and subdirectory paths in root.
+
+    As os.walk, symlinked directories are not followed and a directory that
+    cannot be listed is taken to be empty. If given, subdirectories whose
+    name dir_filter returns False for are left out.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return [], []
+
+    files = []
+    dirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+
+        if not is_dir:
+            files.append(entry)
+        elif not entry.is_symlink():
+            if dir_filter is None or dir_filter(entry.name):
+                dirs.append(entry.path)
+
+    return files, dirs
+
+
 class FAAMFlight(object):
+    __slots__ = ('flightnum', 'date', '_accessors')
+
     def __init__(self, flightnum=None, date=None):
         self.flightnum = flightnum
         self.date = date
         self._accessors = {}
 
     def __getattr__(self, attr):
-        try:
-            return self._accessors[attr]
-        except KeyError:
-            pass
-
-        try:
-            return self.__dict__[attr]
-        except KeyError:
-            pass
+        # Only called if attr is not a slot, so may only be an accessor.
+        # Dunder names probed by copy, pickle, IPython etc. never are, nor
+        # is _accessors itself if it has not been set yet.
+        if not (attr.startswith('__') or attr == '_accessors'):
+            accessor = self._accessors.get(attr)
+            if accessor is not None:
+                return accessor
 
         raise AttributeError(
             'Not an an attribute or accessor: {}'.format(attr)
@@ -40,33 +98,39 @@ class FAAMFlight(object):
     def add_accessor(self, accessor):
         self._accessors[accessor.hook] = accessor
 
+
 class FAAMFile(object):
-    def __init__(self, path, rex=None):
+    # There may be very many of these in a FAAM archive
+    __slots__ = ('_path', '_rex', '_version', '_revision', '_freq', '_ext')
+
+    def __init__(self, path, rex=None, match=None):
         self._path = path
         self._rex = rex
 
-        if rex:
+        # The match of rex on the file name may be given if already known
+        _match = match
+        if _match is None and rex:
             _match = rex.match(os.path.basename(self._path))
-            if _match:
-                try:
-                    self._version = int(_match['version'])
-                except (IndexError, KeyError, ValueError):
-                    self._version = None
-
-                try:
-                    self._revision = int(_match['revision'])
-                except (IndexError, KeyError, ValueError):
-                    self._revision = None
-
-                try:
-                    self._freq = int(_match['freq'])
-                except (IndexError, KeyError, ValueError):
-                    self._freq = FULL_FREQ
-
-                try:
-                    self._ext = _match['ext']
-                except (IndexError, KeyError, ValueError):
-                    self._ext = None
+
+        if _match:
+            # Fields missing from, or empty in, the file name are None
+            _fields = _match.groupdict()
+
+            def _int(key):
+                # At most one leading sign, so that int() cannot raise
+                value = _fields.get(key)
+                if value:
+                    digits = value[1:] if value[0] == '-' else value
+                    if digits.isdecimal():
+                        return int(value)
+                return None
+
+            self._version = _int('version')
+            self._revision = _int('revision')
+            self._freq = _int('freq')
+            if self._freq is None:
+                self._freq = FULL_FREQ
+            self._ext = _fields.get('ext')
 
     def __str__(self):
         return self._path
@@ -94,34 +158,154 @@ class FAAMFile(object):
 
 
 class FAAM(object):
-
-    def __init__(self, paths=None):
+    """Finds FAAM data files in paths and sorts them by flight
+
+    Args:
+        paths (:obj:`list`): Files and/or directories to search for FAAM
+            data files. Directories are searched recursively.
+        dir_filter (:obj:`callable`): Function of a directory name that
+            returns False for directories that should not be searched. The
+            default skips hidden directories, such as .git. If None then all
+            directories are searched.
+        n_jobs (:obj:`int`): Number of threads used to list directories
+            when walking paths, and by the models of the accessors that read
+            in threads. The default of 1 lists and reads everything in turn,
+            -1 uses as many threads as the executor allows.
+        chunks (:obj:`int`, :obj:`dict` or :obj:`str`): Chunks of the dask
+            arrays returned by the netCDF group models, see
+            `NetCDFDataModel`. Default is None, for no dask arrays.
+    """
+
+    def __init__(self, paths=None, dir_filter=_is_visible, n_jobs=1,
+                 chunks=None):
 
         self.flights = {}
         if paths is None:
             paths = []
         self._paths = paths
+        self._dir_filter = dir_filter
+        self.n_jobs = n_jobs
+
+        # Passed on to the accessors, and from them to their models
+        self._options = {'n_jobs': n_jobs, 'chunks': chunks}
 
         self._accessors = {}
         for hook, accessor in reg_accessors.items():
             self._accessors[hook] = accessor['regex']
 
+        # (hook, regex, accessor class) entries, in order, for matching file
+        # names and making their accessors, and all the accessor regexes in
+        # one, so that each file name is only scanned once to find its
+        # accessor
+        self._hooks = [(hook, accessor['regex'], accessor['class'])
+                       for hook, accessor in reg_accessors.items()]
+        self._combined = _combine_regexes(self._accessors.values())
+
+        # File name extensions of all accessors, lower case as the regexes
+        # ignore case. None if any accessor's extensions are not known.
+        _exts = [accessor['extensions'] for accessor in reg_accessors.values()]
+        if _exts and None not in _exts:
+            self._exts = tuple(set(e.lower() for exts in _exts for e in exts))
+        else:
+            self._exts = None
+
         self._load()
 
     def __getitem__(self, item):
         return self.flights[item.lower()]
 
+    def close(self):
+        """Closes the models of all accessors of all flights"""
+        for flight in self.flights.values():
+            for accessor in flight._accessors.values():
+                accessor.close()
+
     def _load_file(self, _file):
-        for hook, rex in self._accessors.items():
-            match = rex.search(os.path.basename(_file))
+        self._load_name(os.path.basename(_file), os.path.dirname(_file),
+                        _file)
+
+    def _load_name(self, name, root, path=None):
+        """Add file name, in directory root, to the first matching accessor
+
+        The full path of the file may be given as path if already known.
+        """
+        found = self._match_name(name, root, path)
+        if found:
+            self.add_file(*found)
+
+    def _match_name(self, name, root, path=None):
+        """Returns add_file arguments for the first accessor matching name
+
+        Returns:
+            Tuple of (hook, root, match, path, accessor class) or None if no
+            accessor matches file name.
+        """
+        if self._exts is not None and not name.lower().endswith(self._exts):
+            # Cheaply reject files no accessor could match
+            return None
+
+        if self._combined is not None:
+            # The regexes are all anchored so only need to be tried at the
+            # start of name, which search does not know about for the
+            # combined regex
+            match = self._combined.match(name)
+            if match:
+                hook, rex, cls = self._hooks[int(match.lastgroup[2:])]
+                return hook, root, rex.match(name), path, cls
+            return None
+
+        for hook, rex, cls in self._hooks:
+            match = rex.search(name)
             if match:
-                self.add_file(hook, os.path.dirname(_file), match)
-                return
+                return hook, root, match, path, cls
+
+        return None
 
     def _load_dir(self, _dir):
-        for root, dirs, files in os.walk(_dir):
-            for _file in files:
-                self._load_file(os.path.join(root, _file))
+        """
+        Walk _dir top down, in the same order as os.walk, with scandir so that
+        files need not each be stat'ed to tell them from directories.
+
+        If self.n_jobs is set then directories are listed in threads, ahead
+        of the walk, but files are still added here in the same order.
+
+        Files are only matched during the walk, they are added to their
+        accessors once it is done.
+        """
+        pool = None
+        if self.n_jobs not in [None, 0, 1]:
+            pool = ThreadPoolExecutor(
+                max_workers=None if self.n_jobs < 0 else self.n_jobs
+            )
+
+        def _scan(root):
+            # Start listing root now if threaded, otherwise when it is walked
+            if pool is None:
+                return root, None
+            return root, pool.submit(_scan_dir, root, self._dir_filter)
+
+        found = []
+        try:
+            stack = [_scan(_dir)]
+            while stack:
+                root, future = stack.pop()
+                if future is None:
+                    files, dirs = _scan_dir(root, self._dir_filter)
+                else:
+                    files, dirs = future.result()
+
+                for entry in files:
+                    _found = self._match_name(entry.name, root, entry.path)
+                    if _found:
+                        found.append(_found)
+
+                stack.extend(_scan(d) for d in reversed(dirs))
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        for _found in found:
+            self.add_file(*_found)
 
     def _load(self):
         """
@@ -131,25 +315,33 @@ class FAAM(object):
         for _path in self._paths:
             _map[os.path.isfile(_path)](_path)
 
-    def add_file(self, hook, root, match):
+    def add_file(self, hook, root, match, path=None, cls=None):
+        # The accessor class of hook, cls, is given when the file was
+        # matched in self._hooks, so need not be looked up for each file
+        if path is None:
+            path = os.path.join(root, match.string)
+
         flightnum = match['flightnum']
-        date = datetime.datetime.strptime(match['date'], '%Y%m%d')
 
         try:
             flight = self.flights[flightnum]
         except KeyError:
+            # The date is only needed, so parsed, for the first file of a flight
+            date = datetime.datetime.strptime(match['date'], '%Y%m%d')
             flight = FAAMFlight(flightnum, date)
             self.flights[flightnum] = flight
 
-        try:
-            accessor = getattr(flight, hook)
-        except AttributeError:
-            accessor = reg_accessors[hook]['class'](flight)
+        accessor = flight._accessors.get(hook)
+        if accessor is None:
+            if cls is None:
+                cls = reg_accessors[hook]['class']
+            accessor = cls(flight, **self._options)
             flight.add_accessor(accessor)
 
         accessor.add_file(
             FAAMFile(
-                os.path.join(root, match.string),
-                match.re
+                path,
+                match.re,
+                match
             )
         )
@@ -0,0 +1,116 @@
+import os
+
+import numpy as np
+import pytest
+
+from netCDF4 import Dataset
+
+
+def bump_mtime(path, seconds=10):
+    """Moves the modification time of path forward by seconds"""
+    mtime = os.path.getmtime(path) + seconds
+    os.utime(path, (mtime, mtime))
+
+
+def write_groups_nc(path, scale=1):
+    """Writes a netCDF file with nested groups, as core cloud physics files
+
+    The root has the time coordinate, G1 has a variable of time only and
+    G1/G2 has a variable of time and its own bin coordinate, so that the
+    time coordinate of both groups must be found in the root.
+    """
+    with Dataset(path, 'w') as nc:
+        nc.title = 'groups'
+        nc.createDimension('time', 5)
+        _time = nc.createVariable('time', 'f8', ('time',))
+        _time.units = 'seconds since 2020-02-11 00:00:00'
+        _time.standard_name = 'time'
+        _time[:] = np.arange(5)
+
+        _var = nc.createVariable('root_var', 'f4', ('time',))
+        _var.long_name = 'root variable'
+        _var[:] = scale * np.arange(5)
+
+        g1 = nc.createGroup('G1')
+        g1.grp_attr = 'g1'
+        _var = g1.createVariable('a', 'f4', ('time',), fill_value=-9999.)
+        _var.long_name = 'variable a'
+        _var[:] = scale * np.arange(10, 15)
+        _var[2] = np.ma.masked
+
+        g2 = g1.createGroup('G2')
+        g2.createDimension('bin', 3)
+        _bin = g2.createVariable('bin', 'i4', ('bin',))
+        _bin[:] = [1, 2, 3]
+        _var = g2.createVariable('b', 'f4', ('time', 'bin'))
+        _var.long_name = 'variable b'
+        _var.standard_name = 'number_concentration'
+        _var[:] = scale * np.arange(15).reshape(5, 3)
+
+    return path
+
+
+def write_core_nc(path, n=10):
+    """Writes a FAAM core like file of n seconds of 1, 4 and 32Hz data"""
+    with Dataset(path, 'w') as nc:
+        nc.title = 'core'
+        nc.createDimension('Time', n)
+        nc.createDimension('sps04', 4)
+        nc.createDimension('sps32', 32)
+
+        _time = nc.createVariable('Time', 'i4', ('Time',))
+        _time.units = 'seconds since 2020-02-11 00:00:00'
+        _time.long_name = 'time of measurement'
+        _time[:] = 36000 + np.arange(n)
+
+        _var = nc.createVariable('WOW_IND', 'i1', ('Time',), fill_value=-1)
+        _var.long_name = 'weight on wheels'
+        _var[:] = np.r_[np.ones(2), np.zeros(n - 4), np.ones(2)]
+        _var[0] = np.ma.masked
+
+        _var = nc.createVariable('TAT_DI_R', 'f4', ('Time', 'sps32'))
+        _var.long_name = 'true air temperature'
+        _var.standard_name = 'air_temperature'
+        _var[:] = np.arange(n * 32).reshape(n, 32)
+
+        _var = nc.createVariable('PS_RVSM', 'f8', ('Time', 'sps04'))
+        _var.long_name = 'static pressure'
+        _var[:] = np.arange(n * 4).reshape(n, 4)
+
+    return path
+
+
+_FLTSUM_CSV = """\
+Event,Start,Start Hdg / °,Start Hgt / kft,Start Lat / °,Start Long / °,Stop,Stop Hdg / °,Stop Hgt / kft,Stop Lat / °,Stop Long / °,Comment
+Takeoff,2020-02-11 10:00:00,,0.1,16.7,-22.9,,,,,,
+Run 1,2020-02-11 10:20:00,90,1.0,16.8,-23.0,2020-02-11 10:30:00,90,1.0,16.8,-23.5,
+Landing,2020-02-11 12:00:00,,0.1,16.7,-22.9,,,,,,
+"""
+
+
+def write_fltsum_csv(path, events=None):
+    """Writes a csv flight summary, with the run renamed to events if given"""
+    _text = _FLTSUM_CSV
+    if events is not None:
+        _text = _text.replace('Run 1', events)
+    with open(path, 'w', encoding='utf-8') as _csv:
+        _csv.write(_text)
+
+    return path
+
+
+@pytest.fixture
+def groups_nc(tmp_path):
+    return write_groups_nc(
+        str(tmp_path / 'core-cloud-phy_faam_20200211_v001_r0_c224.nc'))
+
+
+@pytest.fixture
+def core_nc(tmp_path):
+    return write_core_nc(str(tmp_path / 'core_faam_20200211_v005_r1_c224.nc'))
+
+
+@pytest.fixture
+def fltsum_csv(tmp_path):
+    return write_fltsum_csv(
+        str(tmp_path / 'flight-sum_faam_20200211_r0_c224.csv'))
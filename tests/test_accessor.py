@@ -0,0 +1,56 @@
+import pytest
+
+from faamda.wrapper import FAAM
+
+from .conftest import bump_mtime, write_fltsum_csv
+
+
+@pytest.fixture
+def flight(tmp_path, core_nc, groups_nc, fltsum_csv):
+    return FAAM([str(tmp_path)])['c224']
+
+
+def test_get_model_reused(flight):
+    model = flight.fltsum._get_model()
+    flight.fltsum.get()
+    flight.fltsum['Run 1']
+    assert flight.fltsum._get_model() is model
+
+
+def test_get_model_renewed_when_modified(flight, monkeypatch):
+    closed = []
+    model = flight.fltsum._get_model()
+    monkeypatch.setattr(model, 'close', lambda: closed.append(model))
+
+    write_fltsum_csv(flight.fltsum.file, events='Profile 1')
+    bump_mtime(flight.fltsum.file)
+    assert flight.fltsum._get_model() is not model
+    assert closed == [model]
+    assert [e['event'] for e in flight.fltsum.get()] == ['Takeoff',
+                                                        'Profile 1',
+                                                        'Landing']
+
+
+def test_core_model_renewed_when_modified(flight):
+    model = flight.core._get_model()
+    assert flight.core['TAT_DI_R'].shape == (320, 1)
+    bump_mtime(flight.core.file)
+    assert flight.core._get_model() is not model
+
+
+def test_model_options(tmp_path, core_nc, groups_nc):
+    flight = FAAM([str(tmp_path)], n_jobs=3, chunks=2)['c224']
+    assert flight.ccp._get_model().n_jobs == 3
+    assert flight.ccp._get_model().chunks == 2
+
+    # Options not taken by the core model are not passed on to it
+    assert flight.core['WOW_IND'].shape == (10, 1)
+
+
+def test_close(tmp_path, core_nc, groups_nc):
+    faam = FAAM([str(tmp_path)])
+    faam['c224'].core.get('Time')
+    faam['c224'].ccp.get('root_var')
+    faam.close()
+    assert faam['c224'].core._model is None
+    assert faam['c224'].ccp._model is None
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from faamda.wrapper.models import CoreNetCDFDataModel
+from faamda.wrapper.models import netcdf
+
+
+def test_get_single_block(core_nc):
+    df = CoreNetCDFDataModel(core_nc)[['WOW_IND', 'PS_RVSM', 'TAT_DI_R']]
+    assert len(df._mgr.blocks) == 1
+    assert df._mgr.blocks[0].values.flags['C_CONTIGUOUS']
+    assert (df.dtypes == np.float64).all()
+
+
+def test_get_keeps_float_precision(core_nc):
+    df = CoreNetCDFDataModel(core_nc)['TAT_DI_R']
+    assert df['TAT_DI_R'].dtype == np.float32
+
+
+def test_get_index(core_nc):
+    m = CoreNetCDFDataModel(core_nc)
+    df = m[['WOW_IND', 'PS_RVSM']]
+    assert df.index.freq == pd.offsets.Nano(250_000_000)
+    assert df.index[0] == pd.Timestamp('2020-02-11 10:00:00')
+    assert len(df) == 40
+    assert m['WOW_IND'].index.freq == pd.offsets.Nano(10**9)
+
+
+def test_get_strided_placement(core_nc):
+    df = CoreNetCDFDataModel(core_nc)[['WOW_IND', 'PS_RVSM']]
+
+    # Lower frequency data are at their own time stamps, NaN in between
+    np.testing.assert_array_equal(df['PS_RVSM'].values, np.arange(40))
+    assert df['WOW_IND'].iloc[1::4].isna().all()
+    assert df['WOW_IND'].iloc[4::4].notna().all()
+
+
+def test_get_masked_as_nan(core_nc):
+    wow = CoreNetCDFDataModel(core_nc)['WOW_IND']['WOW_IND']
+    assert np.isnan(wow.iloc[0])
+    assert wow.iloc[1] == 1
+
+
+def test_get_after_xarray(core_nc):
+    # xarray turns masking off on the shared handle it reads through
+    netcdf.NetCDFDataModel(core_nc).get('WOW_IND')
+    wow = CoreNetCDFDataModel(core_nc)['WOW_IND']['WOW_IND']
+    assert np.isnan(wow.iloc[0])
+
+
+def test_shares_handle(core_nc):
+    m = CoreNetCDFDataModel(core_nc)
+    assert m._open() is netcdf._open_dataset(core_nc)
+    m.close()
+    assert core_nc not in netcdf._handles
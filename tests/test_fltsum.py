@@ -0,0 +1,57 @@
+import datetime
+
+import pytest
+
+from faamda.wrapper.models import FltSumDataModel
+
+from .conftest import bump_mtime, write_fltsum_csv
+
+
+def test_get_csv(fltsum_csv):
+    events = FltSumDataModel(fltsum_csv).get()
+    assert [e['event'] for e in events] == ['Takeoff', 'Run 1', 'Landing']
+    assert events[1]['start_time'] == datetime.datetime(2020, 2, 11, 10, 20)
+    assert events[1]['stop_time'] == datetime.datetime(2020, 2, 11, 10, 30)
+    assert events[0]['stop_time'] is None
+    assert events[0]['start_hdg'] is None
+
+
+def test_get_returns_copies(fltsum_csv):
+    m = FltSumDataModel(fltsum_csv)
+    events = m.get()
+    events[1]['event'] = 'CHANGED'
+    events.reverse()
+
+    assert [e['event'] for e in m.get()] == ['Takeoff', 'Run 1', 'Landing']
+    assert m['run 1']['event'] == 'Run 1'
+
+
+def test_get_parsed_once(fltsum_csv, monkeypatch):
+    m = FltSumDataModel(fltsum_csv)
+    m.get()
+
+    def _fail():
+        raise AssertionError('flight summary parsed again')
+
+    monkeypatch.setattr(m, '_get', lambda: _fail)
+    m.get()
+    m['Run 1']
+
+
+def test_get_reparsed_when_modified(fltsum_csv):
+    m = FltSumDataModel(fltsum_csv)
+    assert m['Run 1']['event'] == 'Run 1'
+
+    write_fltsum_csv(fltsum_csv, events='Profile 1')
+    bump_mtime(fltsum_csv)
+    assert [e['event'] for e in m.get()] == ['Takeoff', 'Profile 1',
+                                             'Landing']
+    with pytest.raises(KeyError):
+        m['Run 1']
+
+
+def test_get_time_event(fltsum_csv):
+    m = FltSumDataModel(fltsum_csv)
+    assert [e['event'] for e in m['2020-02-11 10:25']] == ['Run 1']
+    assert [e['event'] for e in m['2020-02-11 10:00:30']] == ['Takeoff']
+    assert m['2020-02-11 11:00'] == []
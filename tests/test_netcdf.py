@@ -0,0 +1,146 @@
+import os
+
+import numpy as np
+import pytest
+
+from faamda.wrapper.models import NetCDFDataModel
+from faamda.wrapper.models import netcdf
+
+from .conftest import bump_mtime, write_groups_nc
+
+
+def test_get_root_variable(groups_nc):
+    ds = NetCDFDataModel(groups_nc).get('root_var')
+    assert list(ds.data_vars) == ['root_var']
+    np.testing.assert_array_equal(ds['root_var'].values, np.arange(5))
+
+
+def test_get_coords_from_parent_group(groups_nc):
+    # G1 has no time coordinate of its own, it is found in the root
+    ds = NetCDFDataModel(groups_nc).get('G1/a')
+    assert 'time' in ds.coords
+    assert ds['time'].attrs['standard_name'] == 'time'
+    assert ds.attrs['grp_attr'] == 'g1'
+    assert np.isnan(ds['a'].values[2])
+
+
+def test_get_nested_group_variable(groups_nc):
+    ds = NetCDFDataModel(groups_nc).get('G1/G2/b')
+    assert sorted(ds.coords) == ['bin', 'time']
+    assert ds['b'].shape == (5, 3)
+    np.testing.assert_array_equal(ds['bin'].values, [1, 2, 3])
+
+
+def test_get_nested_group_with_grp(groups_nc):
+    m = NetCDFDataModel(groups_nc)
+    assert m.get('b', grp='G1/G2').identical(m.get('G1/G2/b'))
+
+
+def test_get_items_from_several_groups(groups_nc):
+    rd = NetCDFDataModel(groups_nc).get(['root_var', 'G1/a', 'G1/G2/b'])
+    assert list(rd) == ['/', '/G1', '/G1/G2']
+    assert list(rd['/G1/G2'].data_vars) == ['b']
+
+
+def test_get_items_threaded(groups_nc):
+    items = ['root_var', 'G1/a', 'G1/G2/b']
+    serial = NetCDFDataModel(groups_nc).get(items)
+    threaded = NetCDFDataModel(groups_nc, n_jobs=4).get(items)
+    for key in serial:
+        assert threaded[key].identical(serial[key])
+
+
+def test_get_group(groups_nc):
+    rd = NetCDFDataModel(groups_nc).get('G1/G2')
+    assert list(rd) == ['/G1/G2']
+    assert sorted(rd['/G1/G2'].coords) == ['bin', 'time']
+
+
+def test_get_attributes(groups_nc):
+    m = NetCDFDataModel(groups_nc)
+    assert m.get('title') == {'title': 'groups'}
+    assert m.get('G1/grp_attr') == {'G1/grp_attr': 'g1'}
+
+
+def test_get_mixed_types(groups_nc):
+    with pytest.raises(ValueError):
+        NetCDFDataModel(groups_nc).get(['root_var', 'title'])
+
+
+def test_get_missing_item(groups_nc):
+    with pytest.raises(KeyError):
+        NetCDFDataModel(groups_nc).get('not_a_var')
+
+
+def test_find_groups(groups_nc):
+    m = NetCDFDataModel(groups_nc)
+    assert m.find('groups') == ['/', '/G1', '/G1/G2']
+    assert m.find('G1/groups') == ['/G1', '/G1/G2']
+
+
+def test_find_vars(groups_nc):
+    m = NetCDFDataModel(groups_nc)
+    assert m.find('vars') == {'root_var': 'root variable'}
+    assert m.find('G1/vars') == {'G1/a': 'variable a'}
+    assert m.find('vars', grp='G1/G2') == {'G1/G2/b': 'variable b'}
+
+
+def test_find_vars_filterby(groups_nc):
+    m = NetCDFDataModel(groups_nc)
+    assert m.find('G1/G2/vars', filterby='concentration') == {
+        'G1/G2/b': 'variable b'}
+    assert m.find('G1/G2/vars', filterby='temperature') == {}
+
+
+def test_group_spellings_share_view(groups_nc):
+    m = NetCDFDataModel(groups_nc)
+    for grp in ['G1', '/G1', 'G1/']:
+        m.get('a', grp=grp)
+    assert [k for k in netcdf._views if k[0] == groups_nc] == [
+        (groups_nc, 'G1', True), (groups_nc, None, True)]
+
+
+def test_view_isolation(groups_nc):
+    ds = NetCDFDataModel(groups_nc).get('G1/G2/b')
+    ds['b'].attrs['long_name'] = 'CHANGED'
+    ds['b'].values[:] = -1
+    ds['bin'].values[:] = 0
+    ds['time'].attrs['extra'] = 1
+    ds.attrs['extra'] = 1
+
+    ds = NetCDFDataModel(groups_nc).get('G1/G2/b')
+    assert ds['b'].attrs['long_name'] == 'variable b'
+    np.testing.assert_array_equal(ds['b'].values,
+                                  np.arange(15).reshape(5, 3))
+    np.testing.assert_array_equal(ds['bin'].values, [1, 2, 3])
+    assert 'extra' not in ds['time'].attrs
+    assert 'extra' not in ds.attrs
+
+
+def test_readable_after_close(groups_nc):
+    var = NetCDFDataModel(groups_nc).get('G1/G2/b')
+    grp = NetCDFDataModel(groups_nc).get('G1')['/G1']
+    NetCDFDataModel(groups_nc).close()
+
+    assert var['b'].values.sum() == np.arange(15).sum()
+    assert np.nansum(grp['a'].values) == np.arange(10, 15).sum() - 12
+
+
+def test_reopened_when_modified(groups_nc):
+    m = NetCDFDataModel(groups_nc)
+    assert m.get('root_var')['root_var'].values[1] == 1
+    assert m.find('groups') == ['/', '/G1', '/G1/G2']
+
+    # The open file cannot be written to, so is replaced
+    write_groups_nc(groups_nc + '.new', scale=2)
+    os.replace(groups_nc + '.new', groups_nc)
+    bump_mtime(groups_nc)
+    assert m.get('root_var')['root_var'].values[1] == 2
+    assert m.get('G1/G2/b')['b'].values[0, 1] == 2
+
+
+def test_time_of(groups_nc):
+    m = NetCDFDataModel(groups_nc)
+    assert m.time_of('not_a_group') is None
+    assert m.time.name == 'time'
+    assert len(m.time) == 5
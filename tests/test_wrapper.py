@@ -0,0 +1,126 @@
+import os
+import re
+
+import pytest
+
+from faamda.wrapper import FAAM
+from faamda.wrapper.accessors import reg_accessors
+from faamda.wrapper.wrapper import FAAMFile, FULL_FREQ
+
+_NAMES = [
+    'core_faam_20200211_v005_r0_c224.nc',
+    'core_faam_20200211_v005_r1_c224.nc',
+    'core_faam_20200211_v005_r1_c224_1hz.nc',
+    'core_faam_20200211_v005_r1_c224_32hz_prelim.nc',
+    'CORE_FAAM_20200212_V005_R0_C225.NC',
+    'core_faam_20200212_v005_r0_c225_32hzXnc',
+    'core_faam_20200212_v005_r0_c225.nc.bak',
+    'core-cloud-phy_faam_20200211_v001_r0_c224.nc',
+    'core-cloud-phy_faam_20200211_v001_r0_c224_cip15.nc',
+    'core-cloud-phy_faam_20200211_v001_r0_c224_cas.nc',
+    'CDP-1_faam_20200101_v001_r0_cal.nc',
+    'flight-sum_faam_20200211_r0_c224.csv',
+    'flight-sum_faam_20200211_r1_c224.txt',
+    'flight-sum_faam_20200212_r0_c225.pdf',
+    'notes.txt',
+    'README',
+]
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """Tree of empty files named as FAAM data files, and others"""
+    dirs = ['', 'b', 'a', 'a/deeper', '.hidden', 'b/.hidden']
+    for i, _dir in enumerate(dirs):
+        os.makedirs(tmp_path / _dir, exist_ok=True)
+        for name in _NAMES[i::2]:
+            (tmp_path / _dir / name).touch()
+
+    return str(tmp_path)
+
+
+def _walk(paths):
+    """Files of each accessor of each flight, found as FAAM always did"""
+    found = {}
+
+    def _add(path):
+        for hook, accessor in reg_accessors.items():
+            match = accessor['regex'].search(os.path.basename(path))
+            if match:
+                found.setdefault(match['flightnum'], {}).setdefault(
+                    hook, []).append(path)
+                return
+
+    for _path in paths:
+        if os.path.isfile(_path):
+            _add(_path)
+            continue
+        for root, dirs, files in os.walk(_path):
+            for name in files:
+                _add(os.path.join(root, name))
+
+    return found
+
+
+def _found(faam):
+    return {
+        flightnum: {hook: [str(f) for f in accessor._files]
+                    for hook, accessor in flight._accessors.items()}
+        for flightnum, flight in faam.flights.items()
+    }
+
+
+@pytest.mark.parametrize('n_jobs', [1, 4, -1])
+def test_discovery_parity(archive, n_jobs):
+    faam = FAAM([archive], dir_filter=None, n_jobs=n_jobs)
+    assert _found(faam) == _walk([archive])
+    # Flight numbers are as in the file names
+    assert sorted(faam.flights) == ['C225', 'CDP-1', 'c224']
+
+
+def test_discovery_parity_without_combined_regex(archive, monkeypatch):
+    faam = FAAM([], dir_filter=None)
+    monkeypatch.setattr(faam, '_combined', None)
+    monkeypatch.setattr(faam, '_exts', None)
+    faam._paths = [archive]
+    faam._load()
+    assert _found(faam) == _walk([archive])
+
+
+def test_discovery_of_files(archive):
+    paths = [os.path.join(archive, n) for n in sorted(os.listdir(archive))
+             if os.path.isfile(os.path.join(archive, n))]
+    assert _found(FAAM(paths)) == _walk(paths)
+
+
+def test_hidden_dirs_skipped(archive):
+    faam = FAAM([archive])
+    for accessors in _found(faam).values():
+        for files in accessors.values():
+            assert not any('.hidden' in f for f in files)
+    assert _found(FAAM([archive], dir_filter=None)) != _found(faam)
+
+
+def test_flight_attributes(archive):
+    flight = FAAM([archive])['C224']
+    assert flight.flightnum == 'c224'
+    assert flight.date.year == 2020
+    assert flight.core.hook == 'core'
+    with pytest.raises(AttributeError):
+        flight.not_an_accessor
+
+
+@pytest.mark.parametrize('name, version, revision, freq, ext', [
+    ('5_1_32_nc', 5, 1, 32, 'nc'),
+    ('5_1__nc', 5, 1, FULL_FREQ, 'nc'),
+    ('-5_--1_-_', -5, None, FULL_FREQ, ''),
+    ('x_1.5_3x_', None, None, FULL_FREQ, ''),
+])
+def test_file_fields(name, version, revision, freq, ext):
+    rex = re.compile(r'^(?P<version>[^_]*)_(?P<revision>[^_]*)_'
+                     r'(?P<freq>[^_]*)_(?P<ext>[a-z]*)$')
+    _file = FAAMFile(name, rex)
+    assert _file.version == version
+    assert _file.revision == revision
+    assert _file._freq == freq
+    assert _file.ext == ext